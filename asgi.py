@@ -0,0 +1,24 @@
+import os
+
+from a2wsgi import WSGIMiddleware
+
+from main import app as flask_app
+
+# --- ASGI entrypoint (served by Uvicorn) ---
+# get_transcript_api spends nearly all of its time blocked on outbound HTTPS calls
+# made by youtube-transcript-api, which is built on the synchronous `requests` library.
+# Instead of one blocked process per request (Gunicorn sync workers), Uvicorn accepts
+# connections on an event loop and hands each request to a pool of worker threads,
+# so many transcript fetches can be in flight per process.
+# Run with: uvicorn asgi:app --host 0.0.0.0 --port $PORT --loop uvloop --http httptools
+WSGI_THREADS = int(os.environ.get("WSGI_THREADS", 32))
+
+app = WSGIMiddleware(flask_app, workers=WSGI_THREADS)
+flask_app.logger.info(f"ASGI entrypoint initialized with {WSGI_THREADS} WSGI worker threads.")
+
+if __name__ == "__main__":
+    import uvicorn
+
+    port = int(os.environ.get("PORT", 8081))
+    # uvloop (libuv-based event loop) and httptools (C HTTP parser) instead of the pure-Python defaults
+    uvicorn.run("asgi:app", host="0.0.0.0", port=port, loop="uvloop", http="httptools")
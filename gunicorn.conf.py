@@ -0,0 +1,24 @@
+import os
+
+# --- Gunicorn configuration (used by the Procfile: gunicorn -c gunicorn.conf.py) ---
+# Transcript requests are I/O-bound (waiting on YouTube), so the default sync worker,
+# which handles one request at a time, leaves each process idle most of the time.
+# "gthread" runs many requests per worker on a thread pool. Set GUNICORN_WORKER_CLASS to
+# "uvicorn.workers.UvicornWorker" to serve the ASGI entrypoint (asgi.py) instead; it picks
+# uvloop and httptools automatically since they are installed with uvicorn[standard].
+# Set it to "gevent" to multiplex requests on greenlets instead: Gunicorn monkey-patches
+# sockets before loading the app, so requests/urllib3 calls to YouTube yield while waiting.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+wsgi_app = "asgi:app" if worker_class.startswith("uvicorn.") else "main:app"
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8080)}"
+# cpu_count() reports the host's cores, not the container's CPU quota, so it would start far too
+# many workers (each with its own caches and thread pool) on a large shared host. Scale via WEB_CONCURRENCY.
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+threads = int(os.environ.get("GUNICORN_THREADS", 32)) # Only used by gthread workers
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", 1000)) # Only used by gevent workers
+keepalive = 75 # Keep client/load-balancer connections open between requests
+timeout = 120 # A slow YouTube fetch shouldn't get the worker killed
+# Workers touch a heartbeat file every few seconds; keep it on tmpfs rather than the container's disk
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+# Keep the app from touching the network or writing cache.db when main is imported
+os.environ.setdefault('WARMUP_HTTP_SESSION', '0')
+os.environ.setdefault('SQLITE_CACHE_PATH', '')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """
+    Test client whose transcript fetches never leave the process: every video resolves
+    to a small canned payload. Caches and rate-limit counters start empty.
+    """
+    fetched_video_ids = []
+
+    def fake_fetch_transcript_payload(video_id):
+        fetched_video_ids.append(video_id)
+        return {
+            "status": 200,
+            "language_detected": "English (manual)",
+            "transcript": [{"text": "hello", "start": 0.0, "duration": 1.0}],
+            "etag": "0123456789abcdef",
+        }
+
+    monkeypatch.setattr(main, 'fetch_transcript_payload', fake_fetch_transcript_payload)
+    monkeypatch.setattr(main, 'LOCAL_CACHE', main.LocalTTLCache(main.LOCAL_CACHE_MAX_ENTRIES))
+    main.limiter.reset()
+    test_client = main.app.test_client()
+    test_client.fetched_video_ids = fetched_video_ids
+    yield test_client
+    main.limiter.reset()
@@ -0,0 +1,17 @@
+import main
+
+
+def test_cache_stats_is_disabled_without_admin_token(client, monkeypatch):
+    monkeypatch.setattr(main, 'ADMIN_TOKEN', None)
+    assert client.get('/admin/cache_stats').status_code == 404
+    assert client.get('/admin/cache_stats', headers={"Authorization": "Bearer "}).status_code == 404
+
+
+def test_cache_stats_requires_the_admin_token(client, monkeypatch):
+    monkeypatch.setattr(main, 'ADMIN_TOKEN', 's3cret')
+    assert client.get('/admin/cache_stats').status_code == 401
+    assert client.get('/admin/cache_stats', headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = client.get('/admin/cache_stats', headers={"Authorization": "Bearer s3cret"})
+    assert response.status_code == 200
+    assert response.get_json()["local_cache"]["entries"] == 0
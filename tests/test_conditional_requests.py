@@ -0,0 +1,39 @@
+import pytest
+
+import main
+
+VIDEO_ID = "dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize("output_format", ["json", "text", "ndjson"])
+def test_etag_from_first_response_gets_304(client, output_format):
+    url = f"/api/transcript?video_id={VIDEO_ID}&format={output_format}"
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag == f'"0123456789abcdef-{output_format}"'
+
+    revalidated = client.get(url, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.headers["Cache-Control"] == main.TRANSCRIPT_CACHE_CONTROL
+
+
+@pytest.mark.parametrize("encoding", ["br", "gzip"])
+def test_etag_with_compression_suffix_gets_304(client, encoding):
+    # Flask-Compress sends the ETag of a compressed response as "<etag>:<encoding>"
+    response = client.get(
+        f"/api/transcript?video_id={VIDEO_ID}",
+        headers={"If-None-Match": f'"0123456789abcdef-json:{encoding}"'},
+    )
+    assert response.status_code == 304
+
+
+def test_etag_of_another_format_does_not_match(client):
+    response = client.get(
+        f"/api/transcript?video_id={VIDEO_ID}&format=text",
+        headers={"If-None-Match": '"0123456789abcdef-json"'},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"0123456789abcdef-text"'
@@ -0,0 +1,35 @@
+import datetime
+import decimal
+import uuid
+
+import flask
+from flask.json.provider import DefaultJSONProvider
+
+import main
+
+
+def test_orjson_provider_matches_flasks_default_provider():
+    value = {
+        "date": datetime.date(2024, 1, 2),
+        "datetime": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        "decimal": decimal.Decimal("1.50"),
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "nested": [1, "two", None, True],
+    }
+    stock_provider = DefaultJSONProvider(main.app)
+    assert stock_provider.loads(main.app.json.dumps(value)) == stock_provider.loads(stock_provider.dumps(value))
+
+
+def test_jsonify_goes_through_orjson_provider():
+    with main.app.test_request_context():
+        response = flask.jsonify(date=datetime.date(2024, 1, 2))
+    assert response.get_json() == {"date": "Tue, 02 Jan 2024 00:00:00 GMT"}
+
+
+def test_batch_accepts_json_with_or_without_content_type(client):
+    body = b'{"video_ids": ["dQw4w9WgXcQ"]}'
+    for headers in ({"Content-Type": "application/json"}, {"Content-Type": "text/plain"}):
+        response = client.post('/api/transcript_batch', data=body, headers=headers)
+        assert response.status_code == 200
+        assert [item["status"] for item in response.get_json()["results"]] == [200]
+    assert client.post('/api/transcript_batch', data=b'not json').status_code == 400
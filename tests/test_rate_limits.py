@@ -0,0 +1,49 @@
+import main
+
+
+def video_id(n):
+    return f"vid{n:08d}"
+
+
+def test_distinct_videos_share_the_default_limit(client):
+    limit = int(main.RATE_LIMIT_DEFAULT.split('/')[0])
+    status_codes = [client.get(f'/api/transcript?video_id={video_id(n)}').status_code for n in range(limit + 5)]
+    assert status_codes[:limit] == [200] * limit
+    assert status_codes[limit:] == [429] * 5
+
+
+def test_repeats_of_one_video_hit_the_per_video_limit(client):
+    limit = int(main.RATE_LIMIT_TRANSCRIPT.split('/')[0])
+    status_codes = [client.get('/api/transcript?video_id=dQw4w9WgXcQ').status_code for _ in range(limit + 1)]
+    assert status_codes[:limit] == [200] * limit
+    assert status_codes[limit] == 429
+
+
+def test_batch_ids_draw_on_the_shared_video_quota(client):
+    video_quota = int(main.RATE_LIMIT_VIDEOS.split('/')[0])
+    first_batch = [video_id(n) for n in range(main.BATCH_MAX_VIDEO_IDS)]
+    assert client.post('/api/transcript_batch', json={"video_ids": first_batch}).status_code == 200
+
+    remaining = video_quota - len(first_batch)
+    status_codes = [client.get(f'/api/transcript?video_id={video_id(1000 + n)}').status_code for n in range(remaining + 1)]
+    assert status_codes == [200] * remaining + [429]
+    assert client.post('/api/transcript_batch', json={"video_ids": [video_id(2000)]}).status_code == 429
+
+
+def test_clients_behind_the_proxy_get_separate_buckets(client):
+    limit = int(main.RATE_LIMIT_TRANSCRIPT.split('/')[0])
+    for _ in range(limit):
+        assert client.get('/api/transcript?video_id=dQw4w9WgXcQ', headers={"X-Forwarded-For": "203.0.113.1"}).status_code == 200
+    assert client.get('/api/transcript?video_id=dQw4w9WgXcQ', headers={"X-Forwarded-For": "203.0.113.1"}).status_code == 429
+    assert client.get('/api/transcript?video_id=dQw4w9WgXcQ', headers={"X-Forwarded-For": "203.0.113.2"}).status_code == 200
+
+
+def test_oversized_batch_is_rejected_without_draining_the_video_quota(client):
+    video_quota = int(main.RATE_LIMIT_VIDEOS.split('/')[0])
+    oversized_batch = [video_id(n) for n in range(video_quota * 10)]
+    assert client.post('/api/transcript_batch', json={"video_ids": oversized_batch}).status_code == 400
+    assert client.fetched_video_ids == []
+
+    # Only one unit was spent, so a full batch still fits in the quota
+    full_batch = [video_id(n) for n in range(main.BATCH_MAX_VIDEO_IDS)]
+    assert client.post('/api/transcript_batch', json={"video_ids": full_batch}).status_code == 200
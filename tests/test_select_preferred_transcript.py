@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+import main
+
+
+def transcript(language_code, is_generated):
+    return SimpleNamespace(language_code=language_code, is_generated=is_generated)
+
+
+def test_manual_transcript_beats_generated_one():
+    # "ro" comes before "en" in SEARCH_LANGUAGES, but only as an auto-generated track
+    manual_en = transcript('en', is_generated=False)
+    transcript_list = [transcript('ro', is_generated=True), manual_en]
+    assert main.select_preferred_transcript(transcript_list) == (manual_en, "manual")
+
+
+def test_search_languages_order_is_respected():
+    manual_ro = transcript('ro', is_generated=False)
+    transcript_list = [transcript('de', is_generated=False), transcript('en', is_generated=False), manual_ro]
+    assert main.select_preferred_transcript(transcript_list) == (manual_ro, "manual")
+
+
+def test_falls_back_to_generated_transcript_in_search_languages_order():
+    generated_en = transcript('en', is_generated=True)
+    transcript_list = [transcript('fr', is_generated=True), generated_en, transcript('xx', is_generated=False)]
+    assert main.select_preferred_transcript(transcript_list) == (generated_en, "auto-generated")
+
+
+def test_no_transcript_in_search_languages():
+    transcript_list = [transcript('xx', is_generated=False), transcript('yy', is_generated=True)]
+    assert main.select_preferred_transcript(transcript_list) == (None, None)
+    assert main.select_preferred_transcript([]) == (None, None)
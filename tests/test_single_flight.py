@@ -0,0 +1,117 @@
+import threading
+import time
+
+import pytest
+import requests
+
+import main
+
+
+def start_waiters(flight, key, fn, count, timeout=None):
+    """
+    Starts count threads calling flight.do(key, fn); returns them and a list collecting
+    each thread's ("ok", result) or ("error", exception).
+    """
+    outcomes = []
+
+    def call():
+        try:
+            outcomes.append(("ok", flight.do(key, fn, timeout=timeout)))
+        except Exception as e:
+            outcomes.append(("error", e))
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def test_concurrent_callers_share_one_call():
+    flight = main.SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(5)
+        return "payload"
+
+    threads, outcomes = start_waiters(flight, "key", slow_fetch, 8)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert outcomes == [("ok", "payload")] * 8
+
+
+def test_leader_exception_is_raised_to_every_waiter():
+    flight = main.SingleFlight()
+    release = threading.Event()
+
+    def failing_fetch():
+        release.wait(5)
+        raise ValueError("boom")
+
+    threads, outcomes = start_waiters(flight, "key", failing_fetch, 4)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(outcomes) == 4
+    assert all(kind == "error" and isinstance(error, ValueError) for kind, error in outcomes)
+
+
+def test_key_is_released_after_the_call_finishes():
+    flight = main.SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    assert flight._calls == {}
+
+
+def test_waiter_times_out_while_the_leader_is_still_running():
+    flight = main.SingleFlight()
+    release = threading.Event()
+    leader, leader_outcomes = start_waiters(flight, "key", lambda: release.wait(5) and "payload", 1)
+    time.sleep(0.05)
+
+    with pytest.raises(main.SingleFlightTimeout):
+        flight.do("key", lambda: "never runs", timeout=0.05)
+
+    release.set()
+    leader[0].join(5)
+    assert leader_outcomes == [("ok", "payload")]
+
+
+@pytest.mark.parametrize("error, status, message", [
+    (requests.ReadTimeout("Read timed out."), 504, main.ERROR_FETCH_TIMEOUT),
+    (requests.ConnectTimeout("Connect timed out."), 504, main.ERROR_FETCH_TIMEOUT),
+    (main.SingleFlightTimeout("Waited too long"), 504, main.ERROR_FETCH_TIMEOUT),
+    (requests.exceptions.ProxyError("Proxy refused"), 502, main.ERROR_UPSTREAM_UNREACHABLE),
+    (requests.exceptions.SSLError("Bad certificate"), 502, main.ERROR_UPSTREAM_UNREACHABLE),
+    (requests.ConnectionError("Name or service not known"), 502, main.ERROR_UPSTREAM_UNREACHABLE),
+])
+def test_upstream_failures_map_to_gateway_errors(client, monkeypatch, error, status, message):
+    def failing_fetch(video_id):
+        raise error
+
+    monkeypatch.setattr(main, 'fetch_transcript_payload', failing_fetch)
+    response = client.get('/api/transcript?video_id=dQw4w9WgXcQ')
+    assert response.status_code == status
+    assert response.get_json()["error"] == message
+
+
+def test_read_timeouts_are_not_retried():
+    assert main.HTTP_RETRY_POLICY.read is False
+
+
+def test_shared_adapter_fills_in_a_default_timeout(monkeypatch):
+    sent_timeouts = []
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, 'send', lambda self, request, timeout=None, **kwargs: sent_timeouts.append(timeout))
+
+    main.HTTP_ADAPTER.send(requests.Request('GET', 'https://www.youtube.com/').prepare())
+    main.HTTP_ADAPTER.send(requests.Request('GET', 'https://www.youtube.com/').prepare(), timeout=1)
+
+    assert sent_timeouts == [(main.HTTP_CONNECT_TIMEOUT_SECONDS, main.HTTP_READ_TIMEOUT_SECONDS), 1]
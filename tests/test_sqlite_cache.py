@@ -0,0 +1,37 @@
+import main
+
+
+def test_set_then_get_returns_value_and_remaining_ttl(tmp_path):
+    cache = main.SQLiteTTLCache(str(tmp_path / 'cache.db'))
+    cache.set('key', b'value', 60)
+
+    value, remaining_ttl_seconds = cache.get('key')
+    assert value == b'value'
+    assert 0 < remaining_ttl_seconds <= 60
+    assert cache.get('missing') is None
+
+
+def test_entries_expire_after_their_ttl(tmp_path, monkeypatch):
+    cache = main.SQLiteTTLCache(str(tmp_path / 'cache.db'))
+    now = 1_000_000.0
+    monkeypatch.setattr(main.time, 'time', lambda: now)
+    cache.set('key', b'value', 10)
+    assert cache.get('key') == (b'value', 10)
+
+    now += 10
+    assert cache.get('key') is None
+
+
+def test_purge_expired_removes_only_expired_rows(tmp_path):
+    cache = main.SQLiteTTLCache(str(tmp_path / 'cache.db'))
+    cache.set('expired-1', b'a', -1)
+    cache.set('expired-2', b'b', -1)
+    cache.set('live', b'c', 60)
+
+    assert cache.purge_expired() == 2
+    assert cache.purge_expired() == 0
+    assert cache.get('live')[0] == b'c'
+
+    # The rows are gone from the file, not just hidden by get()
+    reopened = main.SQLiteTTLCache(str(tmp_path / 'cache.db'))
+    assert reopened._conn.execute('SELECT key FROM transcript_cache').fetchall() == [('live',)]
@@ -0,0 +1,61 @@
+import orjson
+import pytest
+
+import main
+
+VIDEO_ID = "dQw4w9WgXcQ"
+SEGMENTS = [
+    {"text": "hello", "start": 0.0, "duration": 1.0},
+    {"text": "ünïcode line", "start": 1.0, "duration": 1.5},
+    {"text": "bye", "start": 2.5, "duration": 0.5},
+]
+
+
+@pytest.fixture
+def multi_segment_client(client, monkeypatch):
+    monkeypatch.setattr(main, 'fetch_transcript_payload', lambda video_id: {
+        "status": 200,
+        "language_detected": "English (manual)",
+        "transcript": SEGMENTS,
+        "etag": "0123456789abcdef",
+    })
+    return client
+
+
+def test_ndjson_body_is_one_json_object_per_line(multi_segment_client):
+    response = multi_segment_client.get(f"/api/transcript?video_id={VIDEO_ID}&format=ndjson")
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.data == b''.join(orjson.dumps(segment) + b'\n' for segment in SEGMENTS)
+    assert [orjson.loads(line) for line in response.data.splitlines()] == SEGMENTS
+
+
+def test_text_body_is_segment_texts_joined_by_newlines(multi_segment_client):
+    response = multi_segment_client.get(f"/api/transcript?video_id={VIDEO_ID}&format=text")
+    assert response.status_code == 200
+    assert response.headers['Content-Type'] == 'text/plain; charset=utf-8'
+    assert response.get_data(as_text=True) == "hello\nünïcode line\nbye"
+
+
+def test_pieces_are_grouped_into_chunks_of_about_stream_chunk_bytes(monkeypatch):
+    monkeypatch.setattr(main, 'STREAM_CHUNK_BYTES', 10)
+    chunks = list(main.iter_in_chunks([b'abcd', b'efgh', b'ijkl', b'mn', b'o']))
+    # A chunk is flushed once it reaches the threshold; the remainder goes out last
+    assert chunks == [b'abcdefghijkl', b'mno']
+    assert list(main.iter_in_chunks([])) == []
+
+
+def test_long_transcript_streams_in_several_chunks(client, monkeypatch):
+    segments = [{"text": f"line {index}", "start": float(index), "duration": 1.0} for index in range(5000)]
+    monkeypatch.setattr(main, 'fetch_transcript_payload', lambda video_id: {
+        "status": 200,
+        "language_detected": "English (manual)",
+        "transcript": segments,
+        "etag": "0123456789abcdef",
+    })
+    response = client.get(f"/api/transcript?video_id={VIDEO_ID}&format=ndjson", buffered=False)
+    chunks = list(response.response)
+    response.close()
+    assert len(chunks) > 1
+    assert all(len(chunk) >= main.STREAM_CHUNK_BYTES for chunk in chunks[:-1])
+    assert b''.join(chunks) == b''.join(orjson.dumps(segment) + b'\n' for segment in segments)